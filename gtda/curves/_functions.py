@@ -1,10 +1,8 @@
 # License: GNU AGPLv3
 
-import warnings
-from itertools import product
-
 import numpy as np
-from joblib import Parallel, delayed
+from joblib import Parallel, delayed, effective_n_jobs
+from sklearn.utils import gen_even_slices
 
 _AVAILABLE_FUNCTIONS = {
     "identity": {},
@@ -18,6 +16,25 @@ _AVAILABLE_FUNCTIONS = {
     "average": {"weights": {"type": np.ndarray}}
     }
 
+
+def _average(X, axis, weights=None):
+    # Assumes axis=-1 and, if present, weights normalized to sum to 1 (see
+    # _normalize_weights)
+    if weights is None:
+        return np.mean(X, axis=axis)
+    return np.dot(X, weights)
+
+
+def _normalize_weights(function_params):
+    weights = function_params.get("weights", None)
+    if weights is not None:
+        weights_sum = np.sum(weights)
+        if weights_sum == 0:
+            raise ZeroDivisionError(
+                "Weights sum to zero, can't be normalized.")
+        function_params["weights"] = weights / weights_sum
+
+
 _implemented_function_recipes = {
     "identity": lambda X, axis: X.reshape(len(X), -1),
     "argmax": np.argmax,
@@ -26,27 +43,68 @@ _implemented_function_recipes = {
     "max": np.max,
     "mean": np.mean,
     "std": np.std,
-    "median": np.median,
-    "average": np.average
+    "median": np.median,  # Already uses np.partition, not a full sort
+    "average": _average
     }
 
 
-def _parallel_featurization(Xt, function, function_params, n_jobs):
-    if callable(function):
-        return function(Xt, axis=-1, **function_params)
-    else:  # Assume function is a list or tuple of functions or None
-        channel_idx = [j for j, f in enumerate(function) if f is not None]
-        n_samples = len(Xt)
-        index_pairs = product(range(n_samples), channel_idx)
-        Xt = Parallel(n_jobs=n_jobs)(
-            delayed(function[j])(Xt[i, j], **function_params[j])
-            for i, j in index_pairs
+def _featurize_slice(X, function, function_params, channel_idx):
+    # Arbitrary callables may traverse each curve several times, so give them
+    # unit-stride curves. This is a no-op for C-contiguous input.
+    X = np.ascontiguousarray(X)
+    return [[function[j](x[j], **function_params[j]) for j in channel_idx]
+            for x in X]
+
+
+def _parallel_featurization(Xt, function, function_params, is_vectorized,
+                            n_jobs):
+    n_samples = len(Xt)
+    features = [None] * len(function)
+
+    # Functions from _implemented_function_recipes act along an axis, so each
+    # channel is processed across all samples with a single call. Channels
+    # sharing the same function and no parameters are further batched into
+    # one call.
+    groups = {}
+    channel_idx = []
+    for j, f in enumerate(function):
+        if f is None:
+            continue
+        if is_vectorized[j]:
+            key = (f, j) if function_params[j] else f
+            groups.setdefault(key, []).append(j)
+        else:
+            channel_idx.append(j)
+
+    for channels in groups.values():
+        f, params = function[channels[0]], function_params[channels[0]]
+        # Use a view instead of a gathered copy when channels are contiguous
+        if channels[-1] - channels[0] == len(channels) - 1:
+            X_group = Xt[:, channels[0]:channels[-1] + 1]
+        else:
+            X_group = Xt[:, channels]
+        Xt_group = f(X_group, axis=-1, **params).\
+            reshape(n_samples, len(channels), -1)
+        for k, j in enumerate(channels):
+            features[j] = Xt_group[:, k]
+
+    # Arbitrary callables are applied to one channel of one sample at a time.
+    # Each job visits a slice of samples once and applies all callables to
+    # it, so that the number of dispatched tasks does not scale with
+    # n_samples * n_channels.
+    if channel_idx:
+        Xt_callables = Parallel(n_jobs=n_jobs)(
+            delayed(_featurize_slice)(Xt[s], function, function_params,
+                                      channel_idx)
+            for s in gen_even_slices(n_samples, effective_n_jobs(n_jobs))
             )
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore",
-                                  category=np.VisibleDeprecationWarning)
-            Xt = np.array(Xt)
-        if Xt.dtype == np.dtype('object'):
-            Xt = np.concatenate(list(map(np.ravel, Xt)))
-
-        return Xt.reshape(n_samples, -1)
+        Xt_callables = [x for x_slice in Xt_callables for x in x_slice]
+        for k, j in enumerate(channel_idx):
+            features[j] = np.asarray([x[k] for x in Xt_callables]).\
+                reshape(n_samples, -1)
+
+    features = [f for f in features if f is not None]
+    if not features:
+        return np.empty((n_samples, 0), dtype=Xt.dtype)
+
+    return np.concatenate(features, axis=1)
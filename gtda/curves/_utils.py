@@ -0,0 +1,65 @@
+"""Utility functions for curve processing."""
+# License: GNU AGPLv3
+
+import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
+from sklearn.utils import gen_even_slices
+
+# Approximate number of input entries processed at a time by _diff_rows,
+# chosen so that the scratch buffers for intermediate differences stay in
+# cache
+_DIFF_BLOCK_SIZE = 2 ** 15
+
+
+def _diff_rows(X, order, out):
+    # Same ufuncs as used by np.diff, but writing into preallocated arrays
+    op = np.not_equal if X.dtype == np.bool_ else np.subtract
+    if order == 1:
+        op(X[:, 1:], X[:, :-1], out=out)
+        return
+
+    n_rows, n_bins = X.shape
+    step = max(1, _DIFF_BLOCK_SIZE // n_bins)
+    # Lower-order differences of each block alternate between two scratch
+    # buffers reused across blocks, and the last one is written into out
+    buffers = np.empty((2, min(step, n_rows), n_bins - 1), dtype=X.dtype)
+    for start in range(0, n_rows, step):
+        block = slice(start, min(start + step, n_rows))
+        n_block_rows = block.stop - block.start
+        prev = X[block]
+        for k in range(1, order):
+            curr = buffers[k % 2, :n_block_rows, :n_bins - k]
+            op(prev[:, 1:], prev[:, :-1], out=curr)
+            prev = curr
+        op(prev[:, 1:], prev[:, :-1], out=out[block])
+
+
+def _diff(X, order, n_jobs=None):
+    """Discrete differences of order `order` along the last axis of `X`.
+
+    Equivalent to ``np.diff(X, n=order, axis=-1)``. The output is allocated
+    once and filled in place. For ``order > 1``, rows of `X` are processed in
+    blocks, and intermediate lower-order differences are stored in two small
+    scratch buffers used in rotation. If `n_jobs` is not 1, slices of rows
+    are processed by threads, since NumPy releases the GIL. No input
+    validation is performed, either here or on the slices of rows."""
+    n_bins = X.shape[-1]
+    # As with np.diff, curves with at most `order` bins give empty output
+    Xt = np.empty(X.shape[:-1] + (max(n_bins - order, 0),), dtype=X.dtype)
+    if not Xt.size:
+        return Xt
+    X_rows = X.reshape(-1, n_bins)
+    Xt_rows = Xt.reshape(-1, n_bins - order)
+
+    n_jobs_ = effective_n_jobs(n_jobs)
+    if n_jobs_ == 1:
+        _diff_rows(X_rows, order, Xt_rows)
+    else:
+        # Workers write into slices of Xt, so they must share its memory
+        # even under a process-based joblib.parallel_backend context
+        Parallel(n_jobs=n_jobs, require="sharedmem")(
+            delayed(_diff_rows)(X_rows[s], order, Xt_rows[s])
+            for s in gen_even_slices(len(X_rows), n_jobs_)
+            )
+
+    return Xt
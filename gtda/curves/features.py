@@ -1,18 +1,48 @@
 """Feature extraction from curves."""
 # License: GNU AGPLv3
 
-from copy import deepcopy
+from functools import lru_cache, partial
 from types import FunctionType
 
+import numpy as np
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.utils.validation import check_is_fitted, check_array
 
 from ._functions import _AVAILABLE_FUNCTIONS, _implemented_function_recipes, \
-    _parallel_featurization
+    _normalize_weights, _parallel_featurization
 from ..utils._docs import adapt_fit_transform_docs
 from ..utils.validation import validate_params
 
 
+@lru_cache(maxsize=128)
+def _validate_function(function):
+    # Validation of the `function` parameter of StandardFeatures. Memoized,
+    # as the outcome only depends on `function` (a list should be converted
+    # to a tuple) and repeated fits often use identical values.
+    references = {"function": StandardFeatures._hyperparameters["function"]}
+    if not isinstance(function, str):
+        # Only the "function" entry needs to differ
+        references["function"] = {
+            key: value for key, value in references["function"].items()
+            if key != "in"
+            }
+    try:
+        validate_params({"function": function}, references)
+    # Another go if we fail because function is a list/tuple containing
+    # instances of FunctionType and the "in" key checks fail
+    except ValueError as ve:
+        end_string = f"which is not in " \
+                     f"{tuple(_AVAILABLE_FUNCTIONS.keys())}."
+        if ve.args[0].endswith(end_string) \
+                and isinstance(function, (list, tuple)):
+            validate_params(
+                {"function": [f for f in function if isinstance(f, str)]},
+                references
+                )
+        else:
+            raise ve
+
+
 @adapt_fit_transform_docs
 class StandardFeatures(BaseEstimator, TransformerMixin):
     """Standard features from multi-channel curves.
@@ -47,7 +77,8 @@ class StandardFeatures(BaseEstimator, TransformerMixin):
         allowed strings, the dictionary keys are as follows:
 
         - If ``function == "average"``, the only key is ``"weights"``
-          (np.ndarray or None, default: ``None``).
+          (np.ndarray or None, default: ``None``). Weights are normalized to
+          sum to 1 in :meth:`fit`.
         - Otherwise, there are no allowed keys.
 
         If `function` is a list or tuple, `function_params` must be a list or
@@ -57,7 +88,8 @@ class StandardFeatures(BaseEstimator, TransformerMixin):
     n_jobs : int or None, optional, default: ``None``
         The number of jobs to use for the computation. ``None`` means 1 unless
         in a :obj:`joblib.parallel_backend` context. ``-1`` means using all
-        processors. Ignored if `function` is one of the allowed string options.
+        processors. Only used to parallelize the application of callables
+        which are not among the allowed string options.
 
     Attributes
     ----------
@@ -92,25 +124,19 @@ class StandardFeatures(BaseEstimator, TransformerMixin):
         self.n_jobs = n_jobs
 
     def _validate_params(self):
-        params = self.get_params().copy()
-        _hyperparameters = deepcopy(self._hyperparameters)
-        if not isinstance(self.function, str):
-            _hyperparameters["function"].pop("in")
+        function = self.function
+        if isinstance(function, list):
+            function = tuple(function)
         try:
-            validate_params(params, _hyperparameters, exclude=["n_jobs"])
-        # Another go if we fail because function is a list/tuple containing
-        # instances of FunctionType and the "in" key checks fail
-        except ValueError as ve:
-            end_string = f"which is not in " \
-                         f"{tuple(_AVAILABLE_FUNCTIONS.keys())}."
-            function = params["function"]
-            if ve.args[0].endswith(end_string) \
-                    and isinstance(function, (list, tuple)):
-                params["function"] = [f for f in function
-                                      if isinstance(f, str)]
-                validate_params(params, _hyperparameters, exclude=["n_jobs"])
-            else:
-                raise ve
+            hash(function)
+        except TypeError:
+            _validate_function.__wrapped__(function)
+        else:
+            _validate_function(function)
+        validate_params(
+            {"function_params": self.function_params},
+            {"function_params": self._hyperparameters["function_params"]}
+            )
 
         if isinstance(self.function, (list, tuple)) \
                 and isinstance(self.function_params, dict):
@@ -161,6 +187,8 @@ class StandardFeatures(BaseEstimator, TransformerMixin):
                 validate_params(self.function_params,
                                 _AVAILABLE_FUNCTIONS[self.function])
                 self.effective_function_params_ = self.function_params.copy()
+                if self.function == "average":
+                    _normalize_weights(self.effective_function_params_)
 
         elif isinstance(self.function, FunctionType):
             self.effective_function_ = \
@@ -193,21 +221,46 @@ class StandardFeatures(BaseEstimator, TransformerMixin):
             self.effective_function_ = []
             self.effective_function_params_ = []
             for f, p in zip(self.function, self._effective_function_params):
+                p = {} if p is None else p.copy()
                 if isinstance(f, str):
                     validate_params(p, _AVAILABLE_FUNCTIONS[f])
+                    if f == "average":
+                        _normalize_weights(p)
                     self.effective_function_.\
                         append(_implemented_function_recipes[f])
                 else:
                     self.effective_function_.append(f)
-                self.effective_function_params_.append({} if p is None
-                                                       else p.copy())
+                self.effective_function_params_.append(p)
             self.effective_function_ = tuple(self.effective_function_)
             self.effective_function_params_ = \
                 tuple(self.effective_function_params_)
 
+        if isinstance(self.function, str):
+            # Bind the axis and parameters once so that transform only makes
+            # a single call
+            self._featurizer = partial(self.effective_function_, axis=-1,
+                                       **self.effective_function_params_)
+        else:
+            # Resolve once which channels can be featurized by vectorized
+            # calls across all samples
+            self._is_vectorized = tuple(
+                f in _implemented_function_recipes.values()
+                for f in self.effective_function_
+                )
+            # If all channels share the same such function and no parameters
+            # are passed, a single call over all channels suffices. For
+            # "identity", this returns a view of the input.
+            f = self.effective_function_[0]
+            if all(self._is_vectorized) \
+                    and all(g is f for g in self.effective_function_) \
+                    and not any(self.effective_function_params_):
+                self._featurizer = partial(f, axis=-1)
+            else:
+                self._featurizer = None
+
         return self
 
-    def transform(self, X, y=None):
+    def transform(self, X, y=None, check_input=True):
         """Compute features of multi-channel curves.
 
         Parameters
@@ -219,6 +272,13 @@ class StandardFeatures(BaseEstimator, TransformerMixin):
             There is no need for a target in a transformer, yet the pipeline
             API requires this parameter.
 
+        check_input : bool, optional, default: ``True``
+            Whether to validate `X` with
+            :func:`sklearn.utils.validation.check_array`. Set to ``False`` to
+            skip this check, including the scan for non-finite values, when
+            calling :meth:`transform` directly on an array known to be
+            valid. Pipelines always use the default.
+
         Returns
         -------
         Xt : ndarray of shape (n_samples, n_features)
@@ -228,7 +288,10 @@ class StandardFeatures(BaseEstimator, TransformerMixin):
 
         """
         check_is_fitted(self)
-        Xt = check_array(X, ensure_2d=False, allow_nd=True)
+        if check_input:
+            Xt = check_array(X, ensure_2d=False, allow_nd=True)
+        else:
+            Xt = np.asarray(X)
         if Xt.ndim != 3:
             raise ValueError("Input must be 3-dimensional.")
         if Xt.shape[1] != self.n_channels_:
@@ -236,8 +299,12 @@ class StandardFeatures(BaseEstimator, TransformerMixin):
                              f"`fit`. Passed {Xt.shape[1]}, expected "
                              f"{self.n_channels_}.")
 
-        Xt = _parallel_featurization(Xt, self.effective_function_,
-                                     self.effective_function_params_,
-                                     self.n_jobs)
+        if self._featurizer is not None:
+            # Fast path: a single vectorized reduction over all channels
+            Xt = self._featurizer(Xt).reshape(len(Xt), -1)
+        else:
+            Xt = _parallel_featurization(Xt, self.effective_function_,
+                                         self.effective_function_params_,
+                                         self._is_vectorized, self.n_jobs)
 
         return Xt
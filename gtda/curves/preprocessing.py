@@ -2,12 +2,11 @@
 # License: GNU AGPLv3
 
 import numpy as np
-from joblib import Parallel, delayed, effective_n_jobs
 from plotly.graph_objs import Figure, Scatter
 from sklearn.base import BaseEstimator, TransformerMixin
-from sklearn.utils import gen_even_slices
 from sklearn.utils.validation import check_is_fitted, check_array
 
+from ._utils import _diff
 from ..base import PlotterMixin
 from ..utils._docs import adapt_fit_transform_docs
 from ..utils.intervals import Interval
@@ -32,7 +31,8 @@ class Derivative(BaseEstimator, TransformerMixin, PlotterMixin):
     n_jobs : int or None, optional, default: ``None``
         The number of jobs to use for the computation. ``None`` means 1 unless
         in a :obj:`joblib.parallel_backend` context. ``-1`` means using all
-        processors.
+        processors. Jobs are run in threads, as the computation is performed
+        by NumPy routines which release the GIL.
 
     Attributes
     ----------
@@ -86,7 +86,7 @@ class Derivative(BaseEstimator, TransformerMixin, PlotterMixin):
 
         return self
 
-    def transform(self, X, y=None):
+    def transform(self, X, y=None, check_input=True):
         """Compute derivatives of multi-channel curves.
 
         Parameters
@@ -98,6 +98,13 @@ class Derivative(BaseEstimator, TransformerMixin, PlotterMixin):
             There is no need for a target in a transformer, yet the pipeline
             API requires this parameter.
 
+        check_input : bool, optional, default: ``True``
+            Whether to validate `X` with
+            :func:`sklearn.utils.validation.check_array`. Set to ``False`` to
+            skip this check, including the scan for non-finite values, when
+            calling :meth:`transform` directly on an array known to be
+            valid. Pipelines always use the default.
+
         Returns
         -------
         Xt : ndarray of shape (n_samples, n_channels, n_bins - order)
@@ -106,15 +113,14 @@ class Derivative(BaseEstimator, TransformerMixin, PlotterMixin):
 
         """
         check_is_fitted(self)
-        Xt = check_array(X, ensure_2d=False, allow_nd=True)
+        if check_input:
+            Xt = check_array(X, ensure_2d=False, allow_nd=True)
+        else:
+            Xt = np.asarray(X)
         if Xt.ndim != 3:
             raise ValueError("Input must be 3-dimensional.")
 
-        Xt = Parallel(n_jobs=self.n_jobs)(
-            delayed(np.diff)(Xt[s], n=self.order, axis=-1)
-            for s in gen_even_slices(len(Xt), effective_n_jobs(self.n_jobs))
-            )
-        Xt = np.concatenate(Xt)
+        Xt = _diff(Xt, self.order, n_jobs=self.n_jobs)
 
         return Xt
 
@@ -183,13 +189,13 @@ class Derivative(BaseEstimator, TransformerMixin, PlotterMixin):
         if channels is None:
             channels = range(self.n_channels_)
 
-        samplings = np.arange(Xt[sample].shape[0])
-        for ix, channel in enumerate(channels):
-            fig.add_trace(Scatter(x=samplings,
-                                  y=Xt[sample][ix],
-                                  mode="lines",
-                                  showlegend=True,
-                                  name=f"Channel {channel}"))
+        samplings = np.arange(Xt[sample].shape[-1])
+        fig.add_traces([Scatter(x=samplings,
+                                y=Xt[sample][channel],
+                                mode="lines",
+                                showlegend=True,
+                                name=f"Channel {channel}")
+                        for channel in channels])
 
         # Update traces and layout according to user input
         if plotly_params:
@@ -234,3 +234,71 @@ def test_standard_transform_function_params():
     Xt = sf.fit_transform(X)
 
     assert_almost_equal(Xt, X[:, :, 0])
+
+
+@pytest.mark.parametrize("function",
+                         ["identity", "argmax", "argmin", "median", "std"])
+def test_standard_transform_list_of_strings(function):
+    sf = StandardFeatures(function=function)
+    Xt = sf.fit_transform(X)
+
+    sf.set_params(function=[function] * X.shape[1])
+    assert_almost_equal(sf.fit_transform(X), Xt)
+
+
+def test_standard_transform_grouped_channels():
+    X_4 = np.concatenate([X, X[:, ::-1]], axis=1)
+    sf = StandardFeatures(function=["max", "identity", "max", scalar_fn])
+    Xt = sf.fit_transform(X_4)
+
+    assert_almost_equal(Xt[:, 0], X_res["max"][:, 0])
+    assert_almost_equal(Xt[:, 1:X.shape[2] + 1], X[:, 1])
+    assert_almost_equal(Xt[:, -2], X_res["max"][:, 1])
+    assert_almost_equal(Xt[:, -1], X[:, 0, 0])
+
+
+def test_standard_average_unnormalized_weights():
+    weights = np.arange(X.shape[-1], dtype=float)
+    X_avg = np.average(X, axis=-1, weights=weights)
+    sf = StandardFeatures(function="average",
+                          function_params={"weights": weights})
+
+    assert_almost_equal(sf.fit_transform(X), X_avg)
+
+    sf.set_params(function=["average", "average"],
+                  function_params=[{"weights": weights}, None])
+    assert_almost_equal(sf.fit_transform(X)[:, 0], X_avg[:, 0])
+
+    sf.set_params(function="average",
+                  function_params={"weights": np.zeros(X.shape[-1])})
+    with pytest.raises(ZeroDivisionError):
+        sf.fit(X)
+
+
+def test_standard_transform_no_check_input():
+    sf = StandardFeatures(function=["max", scalar_fn]).fit(X)
+
+    assert_almost_equal(sf.transform(X, check_input=False), sf.transform(X))
+
+
+def test_standard_transform_non_contiguous():
+    X_strided = np.repeat(X, 2, axis=-1)[:, :, ::2]
+    sf = StandardFeatures(function=["mean", vector_fn])
+
+    assert_almost_equal(sf.fit_transform(X_strided), sf.fit_transform(X))
+
+
+@pytest.mark.parametrize("function", ["identity", ["identity", "identity"]])
+def test_standard_identity_is_view(function):
+    sf = StandardFeatures(function=function)
+    Xt = sf.fit_transform(X)
+
+    assert_almost_equal(Xt, X_res["identity"])
+    assert np.shares_memory(Xt, X)
+
+
+@pytest.mark.parametrize("function", ["max", "argmin", "median", "average"])
+def test_standard_transform_output_c_contiguous(function):
+    Xt = StandardFeatures(function=function).fit_transform(X)
+
+    assert Xt.flags.c_contiguous
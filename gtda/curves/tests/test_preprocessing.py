@@ -3,6 +3,7 @@
 import pytest
 import numpy as np
 import plotly.io as pio
+from joblib import parallel_backend
 from numpy.testing import assert_almost_equal
 from sklearn.exceptions import NotFittedError
 from gtda.curves import Derivative
@@ -63,3 +64,48 @@ def test_consistent_fit_transform_plot(channels):
     d = Derivative()
     Xt = d.fit_transform(X)
     d.plot(Xt, channels=channels, plotly_params=plotly_params)
+
+
+@pytest.mark.parametrize("order", [1, 2, 5])
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_derivative_transform_large_input(order, n_jobs):
+    X_large = np.random.rand(40, 3, 1000)
+    d = Derivative(order=order, n_jobs=n_jobs)
+
+    assert_almost_equal(d.fit_transform(X_large),
+                        np.diff(X_large, n=order, axis=-1))
+
+
+def test_derivative_plot_traces():
+    d = Derivative()
+    Xt = d.fit_transform(X)
+    fig = d.plot(Xt, channels=[1])
+
+    assert len(fig.data) == 1
+    assert_almost_equal(fig.data[0].x, np.arange(Xt.shape[-1]))
+    assert_almost_equal(fig.data[0].y, Xt[0, 1])
+
+
+def test_derivative_transform_no_check_input():
+    d = Derivative().fit(X)
+
+    assert_almost_equal(d.transform(X, check_input=False), X_res[1])
+
+
+@pytest.mark.parametrize("n_bins", [1, 3, 5])
+def test_derivative_transform_short_curves(n_bins):
+    d = Derivative(order=5).fit(np.random.rand(2, 3, 10))
+    X_short = np.random.rand(2, 3, n_bins)
+    Xt = d.transform(X_short)
+
+    assert Xt.shape == (2, 3, 0)
+    assert_almost_equal(Xt, np.diff(X_short, n=5, axis=-1))
+
+
+def test_derivative_transform_loky_backend():
+    X_large = np.random.rand(40, 3, 1000)
+    d = Derivative(order=2)
+    with parallel_backend('loky', n_jobs=2):
+        Xt = d.fit_transform(X_large)
+
+    assert_almost_equal(Xt, np.diff(X_large, n=2, axis=-1))
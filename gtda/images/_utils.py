@@ -1,8 +1,11 @@
 """Helper functions for image processing."""
 # License: GNU AGPLv3
 
+from functools import lru_cache
+
 import numpy as np
 from scipy import ndimage as ndi
+from sklearn.utils import gen_even_slices
 
 
 def _dilate(X, min_iteration, max_iteration, min_value, max_value):
@@ -21,3 +24,24 @@ def _dilate(X, min_iteration, max_iteration, min_value, max_value):
 def _erode(X, min_iteration, max_iteration, min_value, max_value):
     return _dilate(np.logical_not(X), min_iteration, max_iteration,
                    min_value, max_value)
+
+
+@lru_cache(maxsize=32)
+def _even_slices(n_samples, n_jobs):
+    # Materialized output of gen_even_slices, cached since transformers are
+    # typically called repeatedly on collections of the same size. n_jobs
+    # should be the output of joblib.effective_n_jobs, which depends on the
+    # active joblib backend and so is not cached.
+    return tuple(gen_even_slices(n_samples, n_jobs))
+
+
+@lru_cache(maxsize=32)
+def _pad_slices(image_shape, padding):
+    # Shape of the padded images, and slices selecting the original images
+    # inside a collection of padded images. Arguments must be tuples of ints
+    # so they can be cached.
+    shape = tuple(n + 2 * p for n, p in zip(image_shape, padding))
+    interior = (slice(None),) + tuple(
+        slice(p, p + n) for n, p in zip(image_shape, padding)
+        )
+    return shape, interior
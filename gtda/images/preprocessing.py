@@ -8,9 +8,9 @@ from numbers import Real, Integral
 import numpy as np
 from joblib import Parallel, delayed, effective_n_jobs
 from sklearn.base import BaseEstimator, TransformerMixin
-from sklearn.utils import gen_even_slices
 from sklearn.utils.validation import check_array, check_is_fitted
 
+from ._utils import _even_slices, _pad_slices
 from ..base import PlotterMixin
 from ..plotting import plot_point_cloud, plot_heatmap
 from ..utils._docs import adapt_fit_transform_docs
@@ -63,10 +63,11 @@ class Binarizer(BaseEstimator, TransformerMixin, PlotterMixin):
         self.threshold = threshold
         self.n_jobs = n_jobs
 
-    def _binarize(self, X):
-        Xbin = X / self.max_value_ > self.threshold
-
-        return Xbin
+    def _binarize(self, X, out=None):
+        # Comparing X against self.threshold * self.max_value_ instead would
+        # save a division per pixel, but does not round the same way and
+        # changes the result for pixels at the threshold
+        return np.greater(X / self.max_value_, self.threshold, out=out)
 
     def fit(self, X, y=None):
         """Calculate :attr:`n_dimensions_` and :attr:`max_value_` from the
@@ -103,7 +104,7 @@ class Binarizer(BaseEstimator, TransformerMixin, PlotterMixin):
 
         return self
 
-    def transform(self, X, y=None):
+    def transform(self, X, y=None, check_input=True):
         """For each greyscale image in the collection `X`, calculate a
         corresponding binary image by applying the `threshold`. Return the
         collection of binary images.
@@ -118,6 +119,13 @@ class Binarizer(BaseEstimator, TransformerMixin, PlotterMixin):
             There is no need of a target in a transformer, yet the pipeline API
             requires this parameter.
 
+        check_input : bool, optional, default: ``True``
+            Whether to validate `X` with
+            :func:`sklearn.utils.validation.check_array`. Set to ``False`` to
+            skip this check, including the scan for non-finite values, when
+            calling :meth:`transform` directly on an array known to be
+            valid. Pipelines always use the default.
+
         Returns
         -------
         Xt : ndarray of shape (n_samples, n_pixels_x, n_pixels_y \
@@ -127,15 +135,24 @@ class Binarizer(BaseEstimator, TransformerMixin, PlotterMixin):
 
         """
         check_is_fitted(self)
-        Xt = check_array(X, allow_nd=True)
-
-        Xt = Parallel(n_jobs=self.n_jobs)(delayed(
-            self._binarize)(Xt[s])
-            for s in gen_even_slices(len(Xt), effective_n_jobs(self.n_jobs)))
-        Xt = np.concatenate(Xt)
+        if check_input:
+            Xt = check_array(X, allow_nd=True)
+        else:
+            Xt = np.asarray(X)
 
-        if self.n_dimensions_ == 2:
-            Xt = Xt.reshape(X.shape)
+        n_jobs = effective_n_jobs(self.n_jobs)
+        if n_jobs == 1:
+            Xt = self._binarize(Xt)
+        else:
+            # NumPy releases the GIL, so threads can write into disjoint
+            # slices of the same output. Shared memory is required rather
+            # than preferred, as a process-based parallel_backend context
+            # would otherwise make workers write into copies
+            Xbin = np.empty(Xt.shape, dtype=bool)
+            Parallel(n_jobs=self.n_jobs, require="sharedmem")(delayed(
+                self._binarize)(Xt[s], out=Xbin[s])
+                for s in _even_slices(len(Xt), n_jobs))
+            Xt = Xbin
 
         return Xt
 
@@ -230,11 +247,11 @@ class Inverter(BaseEstimator, TransformerMixin, PlotterMixin):
         self.max_value = max_value
         self.n_jobs = n_jobs
 
-    def _invert(self, X):
+    def _invert(self, X, out=None):
         if self.max_value_ is True:
-            return np.logical_not(X)
+            return np.logical_not(X, out=out)
         else:
-            return self.max_value_ - X
+            return np.subtract(self.max_value_, X, out=out)
 
     def fit(self, X, y=None):
         """Calculate :attr:`n_dimensions_` and :attr:`max_value_` from the
@@ -276,7 +293,7 @@ class Inverter(BaseEstimator, TransformerMixin, PlotterMixin):
 
         return self
 
-    def transform(self, X, y=None):
+    def transform(self, X, y=None, check_input=True):
         """For each binary image in the collection `X`, calculate its negation.
         Return the collection of negated binary images.
 
@@ -290,6 +307,13 @@ class Inverter(BaseEstimator, TransformerMixin, PlotterMixin):
             There is no need of a target in a transformer, yet the pipeline API
             requires this parameter.
 
+        check_input : bool, optional, default: ``True``
+            Whether to validate `X` with
+            :func:`sklearn.utils.validation.check_array`. Set to ``False`` to
+            skip this check, including the scan for non-finite values, when
+            calling :meth:`transform` directly on an array known to be
+            valid. Pipelines always use the default.
+
         Returns
         -------
         Xt : ndarray of shape (n_samples, n_pixels_x, n_pixels_y \
@@ -299,12 +323,28 @@ class Inverter(BaseEstimator, TransformerMixin, PlotterMixin):
 
         """
         check_is_fitted(self)
-        Xt = check_array(X, allow_nd=True)
+        if check_input:
+            Xt = check_array(X, allow_nd=True)
+        else:
+            Xt = np.asarray(X)
 
-        Xt = Parallel(n_jobs=self.n_jobs)(delayed(
-            self._invert)(Xt[s])
-            for s in gen_even_slices(len(Xt), effective_n_jobs(self.n_jobs)))
-        Xt = np.concatenate(Xt)
+        n_jobs = effective_n_jobs(self.n_jobs)
+        if n_jobs == 1:
+            Xt = self._invert(Xt)
+        else:
+            # NumPy releases the GIL, so threads can write into disjoint
+            # slices of the same output. Shared memory is required rather
+            # than preferred, as a process-based parallel_backend context
+            # would otherwise make workers write into copies
+            if self.max_value_ is True:
+                dtype = bool
+            else:
+                dtype = np.result_type(self.max_value_, Xt)
+            Xinv = np.empty(Xt.shape, dtype=dtype)
+            Parallel(n_jobs=self.n_jobs, require="sharedmem")(delayed(
+                self._invert)(Xt[s], out=Xinv[s])
+                for s in _even_slices(len(Xt), n_jobs))
+            Xt = Xinv
 
         return Xt
 
@@ -431,22 +471,18 @@ class Padder(BaseEstimator, TransformerMixin, PlotterMixin):
                         exclude=['value', 'n_jobs'])
 
         if self.padding is None:
-            self.padding_ = np.ones((self.n_dimensions_,), dtype=int)
+            self.padding_ = np.ones((self.n_dimensions_,), dtype=np.int64)
         elif len(self.padding) != self.n_dimensions_:
             raise ValueError(
                 f"`padding` has length {self.padding} while the input "
                 f"data requires it to have length equal to "
                 f"{self.n_dimensions_}.")
         else:
-            self.padding_ = self.padding
-
-        self._pad_width = ((0, 0),
-                           *[(self.padding_[axis], self.padding_[axis])
-                             for axis in range(self.n_dimensions_)])
+            self.padding_ = np.asarray(self.padding, dtype=np.int64)
 
         return self
 
-    def transform(self, X, y=None):
+    def transform(self, X, y=None, check_input=True):
         """For each binary image in the collection `X`, adds a padding.
         Return the collection of padded binary images.
 
@@ -460,6 +496,13 @@ class Padder(BaseEstimator, TransformerMixin, PlotterMixin):
             There is no need of a target in a transformer, yet the pipeline API
             requires this parameter.
 
+        check_input : bool, optional, default: ``True``
+            Whether to validate `X` with
+            :func:`sklearn.utils.validation.check_array`. Set to ``False`` to
+            skip this check, including the scan for non-finite values, when
+            calling :meth:`transform` directly on an array known to be
+            valid. Pipelines always use the default.
+
         Returns
         -------
         Xt : ndarray of shape (n_samples, n_pixels_x + 2 * padding_x, \
@@ -469,15 +512,33 @@ class Padder(BaseEstimator, TransformerMixin, PlotterMixin):
 
         """
         check_is_fitted(self)
-        Xt = check_array(X, allow_nd=True)
-
-        Xt = Parallel(n_jobs=self.n_jobs)(delayed(
-            np.pad)(Xt[s], pad_width=self._pad_width,
-                    constant_values=self.value)
-            for s in gen_even_slices(len(Xt), effective_n_jobs(self.n_jobs)))
-        Xt = np.concatenate(Xt)
+        if check_input:
+            Xt = check_array(X, allow_nd=True)
+        else:
+            Xt = np.asarray(X)
+        if Xt.ndim - 1 != self.n_dimensions_:
+            raise ValueError(
+                f"Input of `transform` contains arrays of dimension "
+                f"{Xt.ndim - 1} while `fit` was called on arrays of "
+                f"dimension {self.n_dimensions_}.")
+
+        # Fill the padded output once and copy the images into its interior,
+        # instead of letting np.pad allocate and fill one array per slice
+        shape, interior = _pad_slices(Xt.shape[1:],
+                                      tuple(self.padding_.tolist()))
+        Xt_padded = np.full((len(Xt),) + shape, self.value, dtype=Xt.dtype)
+
+        n_jobs = effective_n_jobs(self.n_jobs)
+        if n_jobs == 1:
+            Xt_padded[interior] = Xt
+        else:
+            # Threads write into disjoint slices of the same output, so
+            # shared memory is required whatever the joblib backend
+            Parallel(n_jobs=self.n_jobs, require="sharedmem")(delayed(
+                np.copyto)(Xt_padded[s][interior], Xt[s])
+                for s in _even_slices(len(Xt), n_jobs))
 
-        return Xt
+        return Xt_padded
 
     @staticmethod
     def plot(Xt, sample=0, colorscale='greys', origin='upper',
@@ -536,6 +597,10 @@ class ImageToPointCloud(BaseEstimator, TransformerMixin, PlotterMixin):
 
     Parameters
     ----------
+    dtype : data-type, optional, default: ``numpy.float32``
+        Data type of the point coordinates in the output. Single precision is
+        exact for images with fewer than :math:`2^{24}` pixels along each axis.
+
     n_jobs : int or None, optional, default: ``None``
         The number of jobs to use for the computation. ``None`` means 1 unless
         in a :obj:`joblib.parallel_backend` context. ``-1`` means using all
@@ -560,12 +625,20 @@ class ImageToPointCloud(BaseEstimator, TransformerMixin, PlotterMixin):
 
     """
 
-    def __init__(self, n_jobs=None):
+    def __init__(self, dtype=np.float32, n_jobs=None):
+        self.dtype = dtype
         self.n_jobs = n_jobs
 
     @staticmethod
-    def _embed(X):
-        return [np.argwhere(x) for x in X]
+    def _embed(X, dtype):
+        # Find active pixels in all images with a single call, then split
+        # the coordinates by sample index
+        sample_idx, *pixel_idx = np.nonzero(X)
+        points = np.empty((len(sample_idx), len(pixel_idx)), dtype=dtype)
+        for axis, idx in enumerate(pixel_idx):
+            points[:, axis] = idx
+        n_points = np.bincount(sample_idx, minlength=len(X))
+        return np.split(points, np.cumsum(n_points)[:-1])
 
     def fit(self, X, y=None):
         """Calculate :attr:`n_dimensions_` from a collection of binary images.
@@ -597,7 +670,7 @@ class ImageToPointCloud(BaseEstimator, TransformerMixin, PlotterMixin):
 
         return self
 
-    def transform(self, X, y=None):
+    def transform(self, X, y=None, check_input=True):
         """For each collection of binary images, calculate the corresponding
         collection of point clouds based on the coordinates of activated
         pixels.
@@ -612,22 +685,39 @@ class ImageToPointCloud(BaseEstimator, TransformerMixin, PlotterMixin):
             There is no need of a target in a transformer, yet the pipeline API
             requires this parameter.
 
+        check_input : bool, optional, default: ``True``
+            Whether to validate `X` with
+            :func:`sklearn.utils.validation.check_array`. Set to ``False`` to
+            skip this check, including the scan for non-finite values, when
+            calling :meth:`transform` directly on an array known to be
+            valid. Pipelines always use the default.
+
         Returns
         -------
         Xt : ndarray of shape (n_samples, n_pixels_x * n_pixels_y [* \
             n_pixels_z], n_dimensions)
             Transformed collection of images. Each entry along axis 0 is a
-            point cloud in ``n_dimensions``-dimensional space.
+            point cloud in ``n_dimensions``-dimensional space, with
+            coordinates of type `dtype`.
 
         """
         check_is_fitted(self)
-        Xt = check_array(X, allow_nd=True)
+        if check_input:
+            Xt = check_array(X, allow_nd=True)
+        else:
+            Xt = np.asarray(X)
 
         Xt = np.swapaxes(np.flip(Xt, axis=1), 1, 2)
-        Xt = Parallel(n_jobs=self.n_jobs)(delayed(
-            self._embed)(Xt[s])
-            for s in gen_even_slices(len(Xt), effective_n_jobs(self.n_jobs)))
-        Xt = reduce(iconcat, Xt, [])
+        n_jobs = effective_n_jobs(self.n_jobs)
+        if n_jobs == 1:
+            Xt = self._embed(Xt, self.dtype)
+        else:
+            # np.nonzero releases the GIL, and threads avoid pickling the
+            # point clouds back from worker processes
+            Xt = Parallel(n_jobs=self.n_jobs, prefer="threads")(delayed(
+                self._embed)(Xt[s], self.dtype)
+                for s in _even_slices(len(Xt), n_jobs))
+            Xt = reduce(iconcat, Xt, [])
         return Xt
 
     @staticmethod
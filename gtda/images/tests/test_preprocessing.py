@@ -4,6 +4,7 @@
 import numpy as np
 import plotly.io as pio
 import pytest
+from joblib import parallel_backend
 from numpy.testing import assert_almost_equal, assert_equal
 from sklearn.exceptions import NotFittedError
 
@@ -59,6 +60,36 @@ def test_binarizer_transform(threshold, expected):
                         expected)
 
 
+@pytest.mark.parametrize("images", [images_2D, images_3D_float,
+                                    -images_3D_float - 1.])
+def test_binarizer_transform_threshold(images):
+    binarizer = Binarizer(threshold=0.3)
+    expected = images / np.max(images) > 0.3
+
+    assert_equal(binarizer.fit_transform(images), expected)
+
+
+@pytest.mark.parametrize("threshold", [0.29, 0.57, 0.58])
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_binarizer_transform_threshold_boundary(threshold, n_jobs):
+    images = np.arange(101).reshape(1, 1, 101)
+    binarizer = Binarizer(threshold=threshold, n_jobs=n_jobs)
+    images_bin = binarizer.fit_transform(images)
+
+    assert_equal(images_bin, images / 100 > threshold)
+    assert not images_bin[0, 0, int(round(threshold * 100))]
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_binarizer_transform_fresh_output(n_jobs):
+    binarizer = Binarizer(n_jobs=n_jobs).fit(images_3D_float)
+    images_bin = binarizer.transform(images_3D_float)
+    images_bin_inv = binarizer.transform(images_3D_float[::-1])
+
+    assert not np.shares_memory(images_bin, images_bin_inv)
+    assert_equal(images_bin, images_bin_inv[::-1])
+
+
 def test_binarizer_fit_transform_plot():
     Binarizer().fit_transform_plot(images_2D, sample=0)
 
@@ -92,6 +123,15 @@ def test_inverter_transform(images, expected):
                         expected)
 
 
+def test_inverter_binarizer_output_stays_bool():
+    images_bin = Binarizer().fit_transform(images_3D_float)
+    assert images_bin.dtype == bool
+
+    images_inv = Inverter().fit_transform(images_bin)
+    assert images_inv.dtype == bool
+    assert_equal(images_inv, ~images_bin)
+
+
 def test_inverter_fit_transform_plot():
     Inverter().fit_transform_plot(images_2D, sample=0)
 
@@ -120,6 +160,32 @@ def test_padder_transform(images, padding):
                  expected_shape)
 
 
+@pytest.mark.parametrize("images", [images_2D, images_3D_float,
+                                    images_3D.astype(bool)])
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_padder_transform_values(images, n_jobs):
+    padding = np.arange(1, images.ndim, dtype=int)
+    value = np.max(images)
+    padder = Padder(padding=padding, value=value, n_jobs=n_jobs)
+    pad_width = ((0, 0), *[(p, p) for p in padding])
+
+    assert_equal(padder.fit_transform(images),
+                 np.pad(images, pad_width, constant_values=value))
+
+
+@pytest.mark.parametrize("padding", [None, np.array([1, 2], dtype=np.int32)])
+def test_padder_padding_dtype(padding):
+    padder = Padder(padding=padding).fit(images_2D)
+
+    assert padder.padding_.dtype == np.int64
+
+
+def test_padder_transform_wrong_dimension():
+    padder = Padder().fit(images_3D)
+    with pytest.raises(ValueError, match="Input of `transform`"):
+        padder.transform(images_2D)
+
+
 def test_padder_fit_transform_plot():
     Padder().fit_transform_plot(images_2D, sample=0)
 
@@ -182,6 +248,57 @@ def test_img2pc_transform(images, expected):
                                  expected))
 
 
+@pytest.mark.parametrize("images", [images_2D_small, images_3D_small])
+def test_img2pc_transform_matches_argwhere(images):
+    img2pc = ImageToPointCloud()
+    images_rotated = np.swapaxes(np.flip(images, axis=1), 1, 2)
+
+    for res, image in zip(img2pc.fit_transform(images), images_rotated):
+        assert res.dtype == np.float32
+        assert_equal(res, np.argwhere(image))
+
+
+def test_img2pc_transform_dtype():
+    img2pc = ImageToPointCloud(dtype=np.float64)
+
+    assert all(res.dtype == np.float64
+               for res in img2pc.fit_transform(images_2D_small))
+
+
 @pytest.mark.parametrize("images", [images_2D, images_3D])
 def test_img2pc_fit_transform_plot(images):
     ImageToPointCloud().fit_transform_plot(images, sample=0)
+
+
+@pytest.mark.parametrize("transformer",
+                         [Binarizer(), Inverter(), Padder(),
+                          ImageToPointCloud()])
+@pytest.mark.parametrize("images", [images_2D, images_3D_float])
+def test_transform_n_jobs(transformer, images):
+    Xt = transformer.set_params(n_jobs=1).fit_transform(images)
+    Xt_parallel = transformer.set_params(n_jobs=2).fit_transform(images)
+
+    for xt, xt_parallel in zip(Xt, Xt_parallel):
+        assert_equal(xt, xt_parallel)
+
+
+@pytest.mark.parametrize("transformer",
+                         [Binarizer(), Inverter(), Padder(),
+                          ImageToPointCloud()])
+def test_transform_no_check_input(transformer):
+    transformer.fit(images_3D_float)
+    Xt = transformer.transform(images_3D_float)
+    Xt_unchecked = transformer.transform(images_3D_float, check_input=False)
+
+    for xt, xt_unchecked in zip(Xt, Xt_unchecked):
+        assert_equal(xt, xt_unchecked)
+
+
+@pytest.mark.parametrize("transformer", [Binarizer(), Inverter(), Padder()])
+@pytest.mark.parametrize("images", [images_2D, images_3D_float])
+def test_transform_loky_backend(transformer, images):
+    Xt = transformer.set_params(n_jobs=1).fit_transform(images)
+    with parallel_backend('loky', n_jobs=2):
+        Xt_loky = transformer.set_params(n_jobs=None).fit_transform(images)
+
+    assert_equal(Xt, Xt_loky)
@@ -334,3 +334,10 @@ def test_check_collection_list_of_list():
     X = [list(range(2)), list(range(3))]
     Xnew = check_collection(X)
     assert np.array_equal(np.array(X[0]), Xnew[0])
+
+
+def test_check_collection_list_keeps_shapes():
+    X = [np.ones(2), np.ones((2, 3)), np.ones((2, 3, 4))]
+    Xnew = check_collection(X)
+
+    assert [x.shape for x in Xnew] == [x.shape for x in X]
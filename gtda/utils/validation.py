@@ -1,8 +1,6 @@
 """Utilities for input validation."""
 # License: GNU AGPLv3
 
-from functools import reduce
-from operator import and_
 from warnings import warn
 
 import numpy as np
@@ -59,25 +57,27 @@ def check_diagrams(X, copy=False):
             f"components, but there are {X_array.shape[2]} components."
             )
 
-    homology_dimensions = sorted(np.unique(X_array[0, :, 2]))
-    for dim in homology_dimensions:
-        if dim == np.inf:
-            if len(homology_dimensions) != 1:
-                raise ValueError(
-                    f"numpy.inf is a valid homology dimension for a stacked "
-                    f"diagram but it should be the only one: "
-                    f"homology_dimensions = {homology_dimensions}."
-                    )
-        else:
-            if (dim != int(dim)) or (dim < 0):
-                raise ValueError(
-                    f"Homology dimensions should be positive integers or "
-                    f"numpy.inf: {dim} can't be cast to an int of the same "
-                    f"value."
-                    )
+    homology_dimensions = np.unique(X_array[0, :, 2])
+    is_inf = homology_dimensions == np.inf
+    if is_inf.any() and len(homology_dimensions) != 1:
+        raise ValueError(
+            f"numpy.inf is a valid homology dimension for a stacked "
+            f"diagram but it should be the only one: "
+            f"homology_dimensions = {homology_dimensions.tolist()}."
+            )
+    finite_dimensions = homology_dimensions[~is_inf]
+    is_invalid = (finite_dimensions != np.floor(finite_dimensions)) | \
+        (finite_dimensions < 0)
+    if is_invalid.any():
+        raise ValueError(
+            f"Homology dimensions should be positive integers or "
+            f"numpy.inf: {finite_dimensions[is_invalid][0]} can't be cast "
+            f"to an int of the same value."
+            )
 
-    n_points_below_diag = np.sum(X_array[:, :, 1] < X_array[:, :, 0])
-    if n_points_below_diag:
+    # Points are only counted once the cheaper check has failed
+    if not np.all(X_array[:, :, 1] >= X_array[:, :, 0]):
+        n_points_below_diag = np.sum(X_array[:, :, 1] < X_array[:, :, 0])
         raise ValueError(
             f"All points of all persistence diagrams should be above the "
             f"diagonal, i.e. X[:, :, 1] >= X[:, :, 0]. {n_points_below_diag} "
@@ -92,43 +92,45 @@ def check_graph(X):
     return X
 
 
-def _validate_params(parameters, references, rec_name=None):
-    types_tuple = (list, tuple, np.ndarray, dict)
-
-    def _validate_params_single(_parameter, _reference, _name):
-        if _reference is None:
-            return
-
-        _ref_type = _reference.get('type', None)
-
-        # Check that _parameter has the correct type
-        if not ((_ref_type is None) or isinstance(_parameter, _ref_type)):
-            raise TypeError(f"Parameter `{_name}` is of type "
-                            f"{type(_parameter)} while it should be of type "
-                            f"{_ref_type}.")
-
-        # If neither the reference type is list, tuple, np.ndarray or dict,
-        # nor _parameter is an instance of one of these types, the checks are
-        # performed on _parameter directly.
-        elif not ((_ref_type in types_tuple)
-                  or isinstance(_parameter, types_tuple)):
-            ref_in = _reference.get('in', None)
-            ref_other = _reference.get('other', None)
-            if _parameter is not None:
-                if not ((ref_in is None) or _parameter in ref_in):
-                    raise ValueError(f"Parameter `{_name}` is {_parameter}, "
-                                     f"which is not in {ref_in}.")
-            # Perform any other checks via the callable ref_others
-            if ref_other is not None:
-                return ref_other(_parameter)
-
-        # Explicitly return the type of _reference if one of list, tuple,
-        # np.ndarray or dict.
-        else:
-            return _ref_type
+_CONTAINER_TYPES = (list, tuple, np.ndarray, dict)
+
 
+def _validate_params_single(_parameter, _reference, _name):
+    if _reference is None:
+        return
+
+    _ref_type = _reference.get('type', None)
+
+    # Check that _parameter has the correct type
+    if not ((_ref_type is None) or isinstance(_parameter, _ref_type)):
+        raise TypeError(f"Parameter `{_name}` is of type "
+                        f"{type(_parameter)} while it should be of type "
+                        f"{_ref_type}.")
+
+    # If neither the reference type is list, tuple, np.ndarray or dict,
+    # nor _parameter is an instance of one of these types, the checks are
+    # performed on _parameter directly.
+    elif not ((_ref_type in _CONTAINER_TYPES)
+              or isinstance(_parameter, _CONTAINER_TYPES)):
+        ref_in = _reference.get('in', None)
+        ref_other = _reference.get('other', None)
+        if _parameter is not None:
+            if not ((ref_in is None) or _parameter in ref_in):
+                raise ValueError(f"Parameter `{_name}` is {_parameter}, "
+                                 f"which is not in {ref_in}.")
+        # Perform any other checks via the callable ref_others
+        if ref_other is not None:
+            return ref_other(_parameter)
+
+    # Explicitly return the type of _reference if one of list, tuple,
+    # np.ndarray or dict.
+    else:
+        return _ref_type
+
+
+def _validate_params(parameters, references, rec_name=None):
     for name, parameter in parameters.items():
-        if name not in references.keys():
+        if name not in references:
             name_extras = "" if rec_name is None else f" in `{rec_name}`"
             raise KeyError(f"`{name}`{name_extras} is not an available "
                            f"parameter. Available parameters are in "
@@ -293,7 +295,7 @@ def check_point_clouds(X, distance_matrices=False, **kwargs):
                 )
 
         if not distance_matrices:
-            if reduce(and_, (x.shape[0] == x.shape[1] for x in X), True):
+            if all(x.shape[0] == x.shape[1] for x in X):
                 warn(
                     "All arrays/matrices are square. This is consistent with "
                     "a collection of distance/adjacency matrices, but the "
@@ -303,7 +305,7 @@ def check_point_clouds(X, distance_matrices=False, **kwargs):
                     )
 
         ref_dim = X[0].shape  # Shape of first sample
-        if reduce(and_, (x.shape == ref_dim for x in X[1:]), True):
+        if all(x.shape == ref_dim for x in X[1:]):
             Xnew = np.asarray(Xnew)
 
     return Xnew